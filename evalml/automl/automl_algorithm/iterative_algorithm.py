@@ -1,4 +1,5 @@
 import inspect
+from functools import lru_cache
 from operator import itemgetter
 
 import numpy as np
@@ -11,6 +12,12 @@ from evalml.pipelines.components.utils import handle_component_class
 from evalml.pipelines.utils import _make_stacked_ensemble_pipeline
 
 
+@lru_cache(maxsize=None)
+def _get_init_params(component_class):
+    """Returns the names of the arguments of the component class' __init__, computed once per class."""
+    return tuple(inspect.signature(component_class.__init__).parameters)
+
+
 class IterativeAlgorithm(AutoMLAlgorithm):
     """An automl algorithm which first fits a base round of pipelines with default parameters, then does a round of parameter tuning on each pipeline in order of performance."""
 
@@ -131,7 +138,7 @@ class IterativeAlgorithm(AutoMLAlgorithm):
         component_graph = [handle_component_class(c) for c in pipeline_class.linearized_component_graph]
         for component_class in component_graph:
             component_parameters = proposed_parameters.get(component_class.name, {})
-            init_params = inspect.signature(component_class.__init__).parameters
+            init_params = _get_init_params(component_class)
 
             # Add the text columns parameter if the component is a TextFeaturizer
             if component_class.name == "Text Featurization Component":
@@ -314,10 +314,9 @@ def calculate_permutation_importance(pipeline, X, y, objective, n_repeats=5, n_j
     mean_perm_importance = perm_importance["importances_mean"]
     if not isinstance(X, pd.DataFrame):
         X = pd.DataFrame(X)
-    feature_names = list(X.columns)
-    mean_perm_importance = list(zip(feature_names, mean_perm_importance))
-    mean_perm_importance.sort(key=lambda x: x[1], reverse=True)
-    return pd.DataFrame(mean_perm_importance, columns=["feature", "importance"])
+    feature_names = np.asarray(X.columns, dtype=object)
+    order = np.argsort(-mean_perm_importance, kind='stable')
+    return pd.DataFrame({"feature": feature_names[order].tolist(), "importance": mean_perm_importance[order]})
 
 
 def graph_permutation_importance(pipeline, X, y, objective, importance_threshold=0):
@@ -0,0 +1,230 @@
+"""Numba-compiled kernels for binary classification objectives.
+
+These are used by the standard binary classification metrics to avoid the input validation
+and label inference overhead of sklearn.metrics on every call. If the labels passed in are not 0/1,
+the objectives fall back to sklearn. If numba is not installed, the confusion matrix is computed
+with np.bincount instead and the remaining objectives fall back to sklearn.
+"""
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _jit(func, python_fallback=False, nogil=False):
+    """Compiles func with numba if it is installed, releasing the GIL while it runs if nogil is True.
+    Otherwise, returns func if python_fallback is True and None if not."""
+    if numba is None:
+        return func if python_fallback else None
+    return numba.njit(cache=True, nogil=nogil)(func)
+
+
+def _vectorize(func, signatures):
+    """Compiles the elementwise func into a numpy ufunc for the given signatures with numba if it is installed. Returns None otherwise."""
+    if numba is None:
+        return None
+    return numba.vectorize(signatures, cache=True)(func)
+
+
+def _confusion_matrix(y_true, y_pred, n_labels):
+    cm = np.zeros((n_labels, n_labels), dtype=np.int64)
+    for i in range(y_true.shape[0]):
+        cm[y_true[i], y_pred[i]] += 1
+    return cm
+
+
+def _precision_from_cm(cm):
+    tp = cm[1, 1]
+    fp = cm[0, 1]
+    if tp + fp == 0:
+        return 0.0
+    return tp / (tp + fp)
+
+
+def _recall_from_cm(cm):
+    tp = cm[1, 1]
+    fn = cm[1, 0]
+    if tp + fn == 0:
+        return 0.0
+    return tp / (tp + fn)
+
+
+def _f1_from_cm(cm):
+    tp = cm[1, 1]
+    fp = cm[0, 1]
+    fn = cm[1, 0]
+    if 2 * tp + fp + fn == 0:
+        return 0.0
+    return 2 * tp / (2 * tp + fp + fn)
+
+
+def _mcc_from_cm(cm):
+    tn = float(cm[0, 0])
+    fp = float(cm[0, 1])
+    fn = float(cm[1, 0])
+    tp = float(cm[1, 1])
+    denominator = (tp + fp) * (tp + fn) * (tn + fp) * (tn + fn)
+    if denominator == 0.0:
+        return 0.0
+    return (tp * tn - fp * fn) / np.sqrt(denominator)
+
+
+def _auc(y_true, y_score):
+    # Mann-Whitney U statistic, with tied scores given their average rank
+    n = y_true.shape[0]
+    order = np.argsort(y_score, kind='mergesort')
+    positive_rank_sum = 0.0
+    n_positive = 0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and y_score[order[j + 1]] == y_score[order[i]]:
+            j += 1
+        average_rank = (i + j + 2) / 2.0
+        for k in range(i, j + 1):
+            if y_true[order[k]] == 1:
+                positive_rank_sum += average_rank
+                n_positive += 1
+        i = j + 1
+    n_negative = n - n_positive
+    return (positive_rank_sum - n_positive * (n_positive + 1) / 2.0) / (n_positive * n_negative)
+
+
+def _log_loss(y_proba, y_true, eps):
+    # Clipping and the log are fused into a single ufunc, so the probabilities are only read once. Like sklearn, the
+    # probability of the negative class is computed from the clipped probability of the positive class
+    p = min(max(y_proba, eps), 1 - eps)
+    if y_true == 1:
+        return -np.log(p)
+    return -np.log(1 - p)
+
+
+# The kernels which loop over the samples release the GIL, so objectives scored in parallel threads
+# by PipelineBase.score(n_jobs=...) can run them concurrently
+_confusion_matrix = _jit(_confusion_matrix, nogil=True)
+# These only do scalar arithmetic on the 2x2 confusion matrix, so they are cheap enough to run uncompiled
+_precision_from_cm = _jit(_precision_from_cm, python_fallback=True)
+_recall_from_cm = _jit(_recall_from_cm, python_fallback=True)
+_f1_from_cm = _jit(_f1_from_cm, python_fallback=True)
+_mcc_from_cm = _jit(_mcc_from_cm, python_fallback=True)
+_auc = _jit(_auc, nogil=True)
+_log_loss = _vectorize(_log_loss, ['float64(float64, int8, float64)'])
+
+
+def _to_binary_labels(y):
+    """Converts y to a contiguous int8 array if all of its values are 0 or 1.
+
+    Arguments:
+        y (pd.Series or np.ndarray): Labels to convert
+
+    Returns:
+        np.ndarray or None: int8 labels, or None if y has labels other than 0 and 1.
+    """
+    y = np.asarray(y)
+    if y.dtype.kind == 'b':
+        return np.ascontiguousarray(y).view(np.int8)
+    if y.dtype.kind not in 'iuf' or not ((y == 0) | (y == 1)).all():
+        return None
+    return np.ascontiguousarray(y, dtype=np.int8)
+
+
+def binary_confusion_matrix(y_true, y_predicted):
+    """Computes the 2x2 confusion matrix for binary labels using the compiled kernel, or a single np.bincount if numba is not installed.
+
+    Arguments:
+        y_true (pd.Series or np.ndarray): Actual class labels of length [n_samples]
+        y_predicted (pd.Series or np.ndarray): Predicted class labels of length [n_samples]
+
+    Returns:
+        np.ndarray or None: Confusion matrix with true labels as rows and predicted labels as columns,
+            or None if the labels are not all 0 or 1 or their lengths differ.
+    """
+    y_true = _to_binary_labels(y_true)
+    if y_true is None or y_true.ndim != 1:
+        return None
+    y_predicted = _to_binary_labels(y_predicted)
+    if y_predicted is None or y_predicted.shape != y_true.shape:
+        # Let sklearn raise its error for inputs of inconsistent lengths
+        return None
+    if _confusion_matrix is None:
+        return np.bincount((y_true.astype(np.intp) << 1) | y_predicted, minlength=4).reshape(2, 2)
+    return _confusion_matrix(y_true, y_predicted, 2)
+
+
+def _to_scores(y):
+    """Converts y to a contiguous float64 array if it is a 1d numeric array.
+
+    Arguments:
+        y (pd.Series or np.ndarray): Scores or probabilities to convert
+
+    Returns:
+        np.ndarray or None: float64 scores, or None if y is not 1d or not numeric.
+    """
+    y = np.asarray(y)
+    if y.ndim != 1 or y.dtype.kind not in 'iuf':
+        return None
+    return np.ascontiguousarray(y, dtype=np.float64)
+
+
+def _binary_labels_and_scores(y_true, y_score):
+    """Converts the labels and scores for the AUC and log loss kernels, returning None if the labels are not 0/1
+    or only one of the two labels is present, since sklearn raises an error for those."""
+    y_true = _to_binary_labels(y_true)
+    if y_true is None or y_true.shape[0] == 0:
+        return None
+    n_positive = y_true.sum(dtype=np.int64)
+    if n_positive == 0 or n_positive == y_true.shape[0]:
+        return None
+    y_score = _to_scores(y_score)
+    if y_score is None or y_score.shape[0] != y_true.shape[0]:
+        return None
+    return y_true, y_score
+
+
+def binary_auc(y_true, y_score):
+    """Computes the area under the ROC curve for binary labels using the compiled kernel.
+
+    Arguments:
+        y_true (pd.Series or np.ndarray): Actual class labels of length [n_samples]
+        y_score (pd.Series or np.ndarray): Predicted scores or probabilities of the positive class of length [n_samples]
+
+    Returns:
+        float or None: The AUC, or None if numba is not installed or the kernel can't be used for these inputs.
+    """
+    if _auc is None:
+        return None
+    labels_and_scores = _binary_labels_and_scores(y_true, y_score)
+    if labels_and_scores is None:
+        return None
+    return _auc(*labels_and_scores)
+
+
+def binary_log_loss(y_true, y_proba, eps=1e-15):
+    """Computes the log loss for binary labels using the compiled kernel. Probabilities are clipped to [eps, 1 - eps] like sklearn.
+
+    Arguments:
+        y_true (pd.Series or np.ndarray): Actual class labels of length [n_samples]
+        y_proba (pd.Series or np.ndarray): Predicted probabilities of the positive class of length [n_samples]
+        eps (float): Amount the probabilities are clipped by. Defaults to 1e-15.
+
+    Returns:
+        float or None: The log loss, or None if numba is not installed or the kernel can't be used for these inputs.
+    """
+    if _log_loss is None:
+        return None
+    labels_and_scores = _binary_labels_and_scores(y_true, y_proba)
+    if labels_and_scores is None:
+        return None
+    y_true, y_proba = labels_and_scores
+    return _log_loss(y_proba, y_true, eps).mean()
+
+
+if numba is not None:
+    # Compile the kernels at import time so the first objective scored does not pay for it
+    _warmup_cm = binary_confusion_matrix(np.array([0, 1], dtype=np.int8), np.array([0, 1], dtype=np.int8))
+    for _kernel in (_precision_from_cm, _recall_from_cm, _f1_from_cm, _mcc_from_cm):
+        _kernel(_warmup_cm)
+    binary_auc(np.array([0, 1], dtype=np.int8), np.array([0.25, 0.75]))
+    binary_log_loss(np.array([0, 1], dtype=np.int8), np.array([0.25, 0.75]))
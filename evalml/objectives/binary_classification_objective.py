@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 from scipy.optimize import minimize_scalar
 
 from .objective_base import ObjectiveBase
@@ -56,6 +57,8 @@ class BinaryClassificationObjective(ObjectiveBase):
             predictions
         """
         ypred_proba = self._standardize_input_type(ypred_proba)
+        if isinstance(ypred_proba, pd.Series):
+            return _threshold_probabilities(ypred_proba, threshold)
         return ypred_proba > threshold
 
     def validate_inputs(self, y_true, y_predicted):
@@ -64,3 +67,17 @@ class BinaryClassificationObjective(ObjectiveBase):
             raise ValueError("y_true contains more than two unique values")
         if len(np.unique(y_predicted)) > 2 and not self.score_needs_proba:
             raise ValueError("y_predicted contains more than two unique values")
+
+
+def _threshold_probabilities(ypred_proba, threshold):
+    """Compares the predicted probabilities to the threshold as a numpy array, which skips the overhead of
+    pandas comparison operators.
+
+    Arguments:
+        ypred_proba (pd.Series): The classifier's predicted probabilities for the positive class
+        threshold (float): Threshold used to make a prediction
+
+    Returns:
+        pd.Series: Boolean predictions with the index and name of ypred_proba
+    """
+    return pd.Series(ypred_proba.to_numpy() > threshold, index=ypred_proba.index, name=ypred_proba.name)
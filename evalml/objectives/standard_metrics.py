@@ -6,6 +6,15 @@ from sklearn import metrics
 from sklearn.preprocessing import label_binarize
 
 from ..utils import classproperty
+from ._fast_metrics import (
+    _f1_from_cm,
+    _mcc_from_cm,
+    _precision_from_cm,
+    _recall_from_cm,
+    binary_auc,
+    binary_confusion_matrix,
+    binary_log_loss
+)
 from .binary_classification_objective import BinaryClassificationObjective
 from .multiclass_classification_objective import (
     MulticlassClassificationObjective
@@ -66,6 +75,9 @@ class F1(BinaryClassificationObjective):
     perfect_score = 1.0
 
     def objective_function(self, y_true, y_predicted, X=None):
+        cm = binary_confusion_matrix(y_true, y_predicted)
+        if cm is not None:
+            return _f1_from_cm(cm)
         return metrics.f1_score(y_true, y_predicted, zero_division=0.0)
 
 
@@ -110,6 +122,9 @@ class Precision(BinaryClassificationObjective):
     perfect_score = 1.0
 
     def objective_function(self, y_true, y_predicted, X=None):
+        cm = binary_confusion_matrix(y_true, y_predicted)
+        if cm is not None:
+            return _precision_from_cm(cm)
         return metrics.precision_score(y_true, y_predicted, zero_division=0.0)
 
 
@@ -154,6 +169,9 @@ class Recall(BinaryClassificationObjective):
     perfect_score = 1.0
 
     def objective_function(self, y_true, y_predicted, X=None):
+        cm = binary_confusion_matrix(y_true, y_predicted)
+        if cm is not None:
+            return _recall_from_cm(cm)
         return metrics.recall_score(y_true, y_predicted, zero_division=0.0)
 
 
@@ -198,6 +216,9 @@ class AUC(BinaryClassificationObjective):
     perfect_score = 1.0
 
     def objective_function(self, y_true, y_predicted, X=None):
+        auc = binary_auc(y_true, y_predicted)
+        if auc is not None:
+            return auc
         return metrics.roc_auc_score(y_true, y_predicted)
 
 
@@ -245,6 +266,9 @@ class LogLossBinary(BinaryClassificationObjective):
     perfect_score = 0.0
 
     def objective_function(self, y_true, y_predicted, X=None):
+        log_loss = binary_log_loss(y_true, y_predicted)
+        if log_loss is not None:
+            return log_loss
         return metrics.log_loss(y_true, y_predicted)
 
 
@@ -267,6 +291,9 @@ class MCCBinary(BinaryClassificationObjective):
     perfect_score = 1.0
 
     def objective_function(self, y_true, y_predicted, X=None):
+        cm = binary_confusion_matrix(y_true, y_predicted)
+        if cm is not None:
+            return _mcc_from_cm(cm)
         with warnings.catch_warnings():
             # catches runtime warning when dividing by 0.0
             warnings.simplefilter('ignore', RuntimeWarning)
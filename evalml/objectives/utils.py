@@ -1,3 +1,4 @@
+from functools import lru_cache
 
 from .objective_base import ObjectiveBase
 
@@ -22,7 +23,12 @@ def get_non_core_objectives():
             objectives.RootMeanSquaredLogError]
 
 
+@lru_cache(maxsize=None)
 def _all_objectives_dict():
+    """Maps the lowercase name of each objective defined in evalml.objectives to its class.
+
+    The subclass search is only done once, so callers must not modify the returned dictionary.
+    """
     all_objectives = _get_subclasses(ObjectiveBase)
     objectives_dict = {}
     for objective in all_objectives:
@@ -1,4 +1,7 @@
 from evalml.objectives import get_objective
+from evalml.objectives.binary_classification_objective import (
+    _threshold_probabilities
+)
 from evalml.pipelines.classification_pipeline import ClassificationPipeline
 from evalml.problem_types import ProblemTypes
 
@@ -33,14 +36,30 @@ class BinaryClassificationPipeline(ClassificationPipeline):
             if not objective.is_defined_for_problem_type(self.problem_type):
                 raise ValueError("You can only use a binary classification objective to make predictions for a binary classification pipeline.")
 
-        if self.threshold is None:
-            return self._component_graph.predict(X)
-        ypred_proba = self.predict_proba(X)
+        X_t = self._compute_estimator_features(X, y=None)
+        if self.threshold is None or objective is None:
+            return self._predict_from_features(X_t)
+        ypred_proba = self._predict_proba_from_features(X_t)
         ypred_proba = ypred_proba.iloc[:, 1]
-        if objective is None:
-            return ypred_proba > self.threshold
         return objective.decision_function(ypred_proba, threshold=self.threshold, X=X)
 
+    def _predict_from_features(self, X_t, y_pred_proba=None):
+        """Make predictions from features which were already computed with compute_estimator_features.
+            If a threshold is set and y_pred_proba is provided, the probabilities are thresholded instead of being recomputed.
+
+        Arguments:
+            X_t (pd.DataFrame): Estimator features of shape [n_samples, n_features]
+            y_pred_proba (pd.DataFrame, optional): Probability estimates already computed from X_t, if available.
+
+        Returns:
+            pd.Series: Estimated labels
+        """
+        if self.threshold is None:
+            return super()._predict_from_features(X_t)
+        if y_pred_proba is None:
+            y_pred_proba = self._predict_proba_from_features(X_t)
+        return _threshold_probabilities(y_pred_proba.iloc[:, 1], self.threshold)
+
     def predict_proba(self, X):
         """Make probability estimates for labels. Assumes that the column at index 1 represents the positive label case.
 
@@ -78,7 +78,8 @@ class ClassificationPipeline(PipelineBase):
         Returns:
             pd.Series: Estimated labels
         """
-        return self._component_graph.predict(X)
+        X_t = self._compute_estimator_features(X, y=None)
+        return self._predict_from_features(X_t)
 
     def predict(self, X, objective=None):
         """Make predictions using selected features.
@@ -102,18 +103,43 @@ class ClassificationPipeline(PipelineBase):
         Returns:
             pd.DataFrame: Probability estimates
         """
-        X = self.compute_estimator_features(X, y=None)
-        proba = self.estimator.predict_proba(X)
+        X = self._compute_estimator_features(X, y=None)
+        return self._predict_proba_from_features(X)
+
+    def _predict_from_features(self, X_t, y_pred_proba=None):
+        """Make predictions from features which were already computed with compute_estimator_features.
+
+        Arguments:
+            X_t (pd.DataFrame): Estimator features of shape [n_samples, n_features]
+            y_pred_proba (pd.DataFrame, optional): Probability estimates already computed from X_t, if available.
+
+        Returns:
+            pd.Series: Estimated labels
+        """
+        return self.estimator.predict(X_t)
+
+    def _predict_proba_from_features(self, X_t):
+        """Make probability estimates from features which were already computed with compute_estimator_features.
+
+        Arguments:
+            X_t (pd.DataFrame): Estimator features of shape [n_samples, n_features]
+
+        Returns:
+            pd.DataFrame: Probability estimates
+        """
+        proba = self.estimator.predict_proba(X_t)
         proba.columns = self._encoder.classes_
         return proba
 
-    def score(self, X, y, objectives):
+    def score(self, X, y, objectives, n_jobs=None):
         """Evaluate model performance on objectives
 
         Arguments:
             X (ww.DataTable, pd.DataFrame or np.ndarray): Data of shape [n_samples, n_features]
             y (ww.DataColumn, pd.Series, or np.ndarray): True labels of length [n_samples]
             objectives (list): List of objectives to score
+            n_jobs (int or None): Number of threads used to score the objectives in parallel once the predictions are computed.
+                None and 1 are equivalent. If set to -1, all CPUs are used. Defaults to None.
 
         Returns:
             dict: Ordered dictionary of objective scores
@@ -124,15 +150,16 @@ class ClassificationPipeline(PipelineBase):
         y = self._encode_targets(y)
         y_predicted, y_predicted_proba = self._compute_predictions(X, objectives)
 
-        return self._score_all_objectives(X, y, y_predicted, y_predicted_proba, objectives)
+        return self._score_all_objectives(X, y, y_predicted, y_predicted_proba, objectives, n_jobs=n_jobs)
 
     def _compute_predictions(self, X, objectives):
-        """Scan through the objectives list and precompute"""
+        """Scan through the objectives list and precompute. The estimator features are only computed once and shared
+        between the predictions and the predicted probabilities."""
         y_predicted = None
         y_predicted_proba = None
-        for objective in objectives:
-            if objective.score_needs_proba and y_predicted_proba is None:
-                y_predicted_proba = self.predict_proba(X)
-            if not objective.score_needs_proba and y_predicted is None:
-                y_predicted = self._predict(X)
+        X_t = self._compute_estimator_features(X, y=None)
+        if any(o.score_needs_proba for o in objectives):
+            y_predicted_proba = self._predict_proba_from_features(X_t)
+        if any(not o.score_needs_proba for o in objectives):
+            y_predicted = self._predict_from_features(X_t, y_pred_proba=y_predicted_proba)
         return y_predicted, y_predicted_proba
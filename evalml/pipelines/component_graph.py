@@ -28,6 +28,7 @@ class ComponentGraph:
             self.component_instances[component_name] = component_class
         self.compute_order = self.generate_order(self.component_dict)
         self.input_feature_names = {}
+        self._compute_plans = {}
         self._i = 0
 
     @classmethod
@@ -78,6 +79,7 @@ class ComponentGraph:
 
             component_instances[component_name] = new_component
         self.component_instances = component_instances
+        self._compute_plans = {}
         return self
 
     def fit(self, X, y):
@@ -167,25 +169,18 @@ class ComponentGraph:
             X = pd.DataFrame(X)
 
         output_cache = {}
-        for component_name in component_list:
-            component_instance = self.get_component(component_name)
-            if not isinstance(component_instance, ComponentBase):
-                raise ValueError('All components must be instantiated before fitting or predicting')
+        for component_name, component_instance, is_transformer, x_parents, y_parent in self._get_compute_plan(component_list):
             x_inputs = []
-            y_input = None
-            for parent_input in self.get_parents(component_name):
-                if parent_input[-2:] == '.y':
-                    if y_input is not None:
-                        raise ValueError(f'Cannot have multiple `y` parents for a single component {component_name}')
-                    y_input = output_cache[parent_input]
-                else:
-                    parent_x = output_cache.get(parent_input, output_cache.get(f'{parent_input}.x'))
-                    if isinstance(parent_x, pd.Series):
-                        parent_x = pd.DataFrame(parent_x, columns=[parent_input])
-                    x_inputs.append(parent_x)
+            y_input = None if y_parent is None else output_cache[y_parent]
+            for parent_input, parent_input_x in x_parents:
+                parent_x = output_cache.get(parent_input, output_cache.get(parent_input_x))
+                if isinstance(parent_x, pd.Series):
+                    parent_x = pd.DataFrame(parent_x, columns=[parent_input])
+                x_inputs.append(parent_x)
             input_x, input_y = self._consolidate_inputs(x_inputs, y_input, X, y)
-            self.input_feature_names.update({component_name: list(input_x.columns)})
-            if isinstance(component_instance, Transformer):
+            if fit:
+                self.input_feature_names[component_name] = input_x.columns.tolist()
+            if is_transformer:
                 if fit:
                     output = component_instance.fit_transform(input_x, input_y)
                 else:
@@ -207,6 +202,39 @@ class ComponentGraph:
                 output_cache[component_name] = output
         return output_cache
 
+    def _get_compute_plan(self, component_list):
+        """Resolves the component instances and parent inputs needed to compute the given components. The result is
+        stored per list of components, so repeated calls to fit, predict or transform skip the lookups.
+
+        Arguments:
+            component_list (list): The list of component names to compute.
+
+        Returns:
+            tuple: A (component_name, component_instance, is_transformer, x_parents, y_parent) tuple per component, where
+                x_parents holds a (parent_name, parent_name.x) pair per X parent and y_parent is the name of the y parent, if any.
+        """
+        compute_plan = self._compute_plans.get(tuple(component_list))
+        if compute_plan is not None:
+            return compute_plan
+        compute_plan = []
+        for component_name in component_list:
+            component_instance = self.get_component(component_name)
+            if not isinstance(component_instance, ComponentBase):
+                raise ValueError('All components must be instantiated before fitting or predicting')
+            x_parents = []
+            y_parent = None
+            for parent_input in self.get_parents(component_name):
+                if parent_input[-2:] == '.y':
+                    if y_parent is not None:
+                        raise ValueError(f'Cannot have multiple `y` parents for a single component {component_name}')
+                    y_parent = parent_input
+                else:
+                    x_parents.append((parent_input, f'{parent_input}.x'))
+            compute_plan.append((component_name, component_instance, isinstance(component_instance, Transformer), tuple(x_parents), y_parent))
+        compute_plan = tuple(compute_plan)
+        self._compute_plans[tuple(component_list)] = compute_plan
+        return compute_plan
+
     @staticmethod
     def _consolidate_inputs(x_inputs, y_input, X, y):
         """ Combines any/all X and y inputs for a component, including handling defaults
@@ -1,12 +1,43 @@
 import numpy as np
+from joblib import effective_n_jobs
 from sklearn.linear_model import LogisticRegression as LogisticRegression
 from skopt.space import Real
+from threadpoolctl import threadpool_limits
 
 from evalml.model_family import ModelFamily
 from evalml.pipelines.components.estimators import Estimator
 from evalml.problem_types import ProblemTypes
 
 
+class _ContiguousLogisticRegression(LogisticRegression):
+    """sklearn LogisticRegression which converts its input to a C-contiguous array of the dtype its solver works in,
+    so the solver does not need to make its own copy. sklearn upcasts to float64 for the other solvers, so only
+    newton-cg, sag and saga are given float32 data.
+
+    While fitting, the number of BLAS threads is limited to n_jobs, so that a classifier asked to use a single core
+    does not start a BLAS thread per CPU underneath the processes or threads parallelizing around it."""
+    _float32_solvers = {"newton-cg", "sag", "saga"}
+
+    def _to_array(self, X):
+        dtype = np.float32 if self.solver in self._float32_solvers else np.float64
+        return np.ascontiguousarray(X, dtype=dtype)
+
+    def _blas_thread_limit(self):
+        """Returns the number of BLAS threads to use while fitting, or None to leave BLAS at its default."""
+        if self.n_jobs is None or self.n_jobs == -1:
+            return None
+        return effective_n_jobs(self.n_jobs)
+
+    def fit(self, X, y, sample_weight=None):
+        X = self._to_array(X)
+        with threadpool_limits(limits=self._blas_thread_limit(), user_api='blas'):
+            return super().fit(X, y, sample_weight=sample_weight)
+
+    def decision_function(self, X):
+        # predict and predict_proba are both computed from decision_function
+        return super().decision_function(self._to_array(X))
+
+
 class LogisticRegressionClassifier(Estimator):
     """
     Logistic Regression Classifier.
@@ -28,8 +59,8 @@ class LogisticRegressionClassifier(Estimator):
                       "solver": solver}
         parameters.update(kwargs)
 
-        lr_classifier = LogisticRegression(random_state=random_state,
-                                           **parameters)
+        lr_classifier = _ContiguousLogisticRegression(random_state=random_state,
+                                                      **parameters)
         super().__init__(parameters=parameters,
                          component_obj=lr_classifier,
                          random_state=random_state)
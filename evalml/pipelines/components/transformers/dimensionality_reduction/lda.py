@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from sklearn.discriminant_analysis import LinearDiscriminantAnalysis as SkLDA
 
@@ -25,16 +26,42 @@ class LinearDiscriminantAnalysis(Transformer):
         parameters = {"n_components": n_components}
         parameters.update(kwargs)
         lda = SkLDA(n_components=n_components, **kwargs)
+        self._component_names = []
+        self._n_features_in = None
         super().__init__(parameters=parameters,
                          component_obj=lda,
                          random_state=random_state)
 
-    def fit(self, X, y):
+    @staticmethod
+    def _convert_to_numeric_data(X, check_missing=True):
+        """Converts X to a pandas DataFrame with numpy dtypes or a numpy array, raising a ValueError if X is not all numeric.
+
+        DataFrames which already only have int, uint or float columns and no missing values are returned as is,
+        since woodwork would infer all of their columns as numeric. Likewise, 2d int, uint or float numpy arrays
+        without missing values are returned as is and handed to sklearn directly. If check_missing is False, numeric
+        DataFrames and arrays are not scanned for missing values.
+        """
+        if isinstance(X, np.ndarray) and X.ndim == 2 and X.dtype.kind in 'iuf':
+            if not check_missing or X.dtype.kind in 'iu' or not np.isnan(X).any():
+                return X
+        elif isinstance(X, pd.DataFrame) and all(dtype.kind in 'iuf' for dtype in X.dtypes):
+            if not check_missing or not X.isnull().values.any():
+                return X
         X = _convert_to_woodwork_structure(X)
         if not is_all_numeric(X):
             raise ValueError("LDA input must be all numeric")
+        return _convert_woodwork_types_wrapper(X.to_dataframe())
+
+    def _wrap_output(self, X_t, X):
+        """Wraps the sklearn output in a DataFrame with component_{i} columns and the index of X, if any."""
+        n_components = X_t.shape[1]
+        if len(self._component_names) != n_components:
+            self._component_names = [f"component_{i}" for i in range(n_components)]
+        return pd.DataFrame(X_t, index=getattr(X, 'index', None), columns=self._component_names)
+
+    def fit(self, X, y):
+        X = self._convert_to_numeric_data(X)
         y = _convert_to_woodwork_structure(y)
-        X = _convert_woodwork_types_wrapper(X.to_dataframe())
         y = _convert_woodwork_types_wrapper(y.to_series())
         n_features = X.shape[1]
         n_classes = y.nunique()
@@ -43,24 +70,22 @@ class LinearDiscriminantAnalysis(Transformer):
             raise ValueError(f"n_components value {n_components} is too large")
 
         self._component_obj.fit(X, y)
+        self._n_features_in = n_features
         return self
 
     def transform(self, X, y=None):
-        X = _convert_to_woodwork_structure(X)
-
-        if not is_all_numeric(X):
-            raise ValueError("LDA input must be all numeric")
-        X = _convert_woodwork_types_wrapper(X.to_dataframe())
+        # Once fit, sklearn rejects missing values itself, so numeric data with the number of features seen during fit
+        # is not scanned for them again
+        n_features = X.shape[1] if len(getattr(X, 'shape', ())) == 2 else None
+        X = self._convert_to_numeric_data(X, check_missing=n_features != self._n_features_in)
         X_t = self._component_obj.transform(X)
-        return pd.DataFrame(X_t, index=X.index, columns=[f"component_{i}" for i in range(X_t.shape[1])])
+        return self._wrap_output(X_t, X)
 
     def fit_transform(self, X, y=None):
-        X = _convert_to_woodwork_structure(X)
-        if not is_all_numeric(X):
-            raise ValueError("LDA input must be all numeric")
+        X = self._convert_to_numeric_data(X)
         y = _convert_to_woodwork_structure(y)
-        X = _convert_woodwork_types_wrapper(X.to_dataframe())
         y = _convert_woodwork_types_wrapper(y.to_series())
 
         X_t = self._component_obj.fit_transform(X, y)
-        return pd.DataFrame(X_t, index=X.index, columns=[f"component_{i}" for i in range(X_t.shape[1])])
+        self._n_features_in = X.shape[1]
+        return self._wrap_output(X_t, X)
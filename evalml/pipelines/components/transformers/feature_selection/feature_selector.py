@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from evalml.pipelines.components.transformers import Transformer
@@ -5,6 +6,7 @@ from evalml.pipelines.components.transformers import Transformer
 
 class FeatureSelector(Transformer):
     """Selects top features based on importance weights"""
+    _selected_mask = None
 
     def get_names(self):
         """Get names of selected features.
@@ -12,9 +14,38 @@ class FeatureSelector(Transformer):
         Returns:
             list of the names of features selected
         """
-        selected_masks = self._component_obj.get_support()
+        selected_masks = self._get_selected_mask()
         return [feature_name for (selected, feature_name) in zip(selected_masks, self.input_feature_names) if selected]
 
+    def _get_selected_mask(self):
+        """Returns the boolean mask of the selected features. The mask is computed when fitting, since computing it
+        requires aggregating the feature importances over every tree of the underlying forest."""
+        if self._selected_mask is None:
+            return self._component_obj.get_support()
+        return self._selected_mask
+
+    def _select_features(self, X):
+        """Selects the columns of X chosen during fit, keeping the index and dtypes of a pd.DataFrame."""
+        if X.shape[1] != len(self._selected_mask):
+            raise ValueError("X has a different shape than during fitting.")
+        if isinstance(X, pd.DataFrame):
+            return X.iloc[:, self._selected_mask]
+        return pd.DataFrame(X[:, self._selected_mask])
+
+    def fit(self, X, y=None):
+        """Fits feature selector on data X
+
+        Arguments:
+            X (pd.DataFrame): Data to fit on
+            y (pd.Series): Target data
+
+        Returns:
+            self
+        """
+        super().fit(X, y)
+        self._selected_mask = self._component_obj.get_support()
+        return self
+
     def transform(self, X, y=None):
         """Transforms data X by selecting features
 
@@ -30,6 +61,8 @@ class FeatureSelector(Transformer):
         else:
             self.input_feature_names = range(X.shape[1])
 
+        if self._selected_mask is not None and isinstance(X, (pd.DataFrame, np.ndarray)):
+            return self._select_features(X)
         try:
             X_t = self._component_obj.transform(X)
         except AttributeError:
@@ -57,14 +90,17 @@ class FeatureSelector(Transformer):
         else:
             self.input_feature_names = range(X.shape[1])
 
+        if isinstance(X, (pd.DataFrame, np.ndarray)):
+            try:
+                self._component_obj.fit(X, y)
+            except AttributeError:
+                raise RuntimeError("Transformer requires a fit_transform method or a component_obj that implements fit_transform")
+            self._selected_mask = self._component_obj.get_support()
+            return self._select_features(X)
+
         try:
             X_t = self._component_obj.fit_transform(X, y)
         except AttributeError:
             raise RuntimeError("Transformer requires a fit_transform method or a component_obj that implements fit_transform")
-        if not isinstance(X_t, pd.DataFrame) and isinstance(X, pd.DataFrame):
-            X_dtypes = X.dtypes.to_dict()
-            selected_col_names = self.get_names()
-            col_types = {key: X_dtypes[key] for key in selected_col_names}
-            return pd.DataFrame(X_t, columns=selected_col_names, index=X.index).astype(col_types)
-        else:
-            return pd.DataFrame(X_t)
+        self._selected_mask = self._component_obj.get_support()
+        return pd.DataFrame(X_t)
@@ -8,7 +8,9 @@ from abc import ABC, abstractmethod
 from collections import OrderedDict
 
 import cloudpickle
+import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 
 from .components import Estimator
 from .components.utils import handle_component_class
@@ -17,7 +19,6 @@ from evalml.exceptions import IllFormattedClassNameError, PipelineScoreError
 from evalml.pipelines import ComponentGraph
 from evalml.pipelines.pipeline_base_meta import PipelineBaseMeta
 from evalml.utils import (
-    _convert_to_woodwork_structure,
     check_random_state_equality,
     classproperty,
     get_logger,
@@ -31,6 +32,8 @@ from evalml.utils import (
 
 logger = get_logger(__file__)
 
+_PASCAL_CASE_BOUNDARY = re.compile(r'(?<=[a-z])(?=[A-Z])')
+
 
 class PipelineBase(ABC, metaclass=PipelineBaseMeta):
     """Base class for all pipelines."""
@@ -76,6 +79,7 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
 
         self._validate_estimator_problem_type()
         self._is_fitted = False
+        self._estimator_features_cache = None
         self._pipeline_params = parameters.get("pipeline", {})
 
     @classproperty
@@ -86,8 +90,7 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
         if cls.custom_name:
             name = cls.custom_name
         else:
-            rex = re.compile(r'(?<=[a-z])(?=[A-Z])')
-            name = rex.sub(' ', cls.__name__)
+            name = _PASCAL_CASE_BOUNDARY.sub(' ', cls.__name__)
             if name == cls.__name__:
                 raise IllFormattedClassNameError("Pipeline Class {} needs to follow Pascal Case standards or `custom_name` must be defined.".format(cls.__name__))
         return name
@@ -97,11 +100,10 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
         """Returns a short summary of the pipeline structure, describing the list of components used.
         Example: Logistic Regression Classifier w/ Simple Imputer + One Hot Encoder
         """
-        component_graph = [handle_component_class(component_class) for component_class in copy.copy(cls.linearized_component_graph)]
+        component_graph = [handle_component_class(component_class) for component_class in cls.linearized_component_graph]
         if len(component_graph) == 0:
             return "Empty Pipeline"
         summary = "Pipeline"
-        component_graph[-1] = component_graph[-1]
 
         if inspect.isclass(component_graph[-1]) and issubclass(component_graph[-1], Estimator):
             estimator_class = component_graph.pop(-1)
@@ -184,13 +186,50 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
         X_t = self._component_graph.compute_final_component_features(X, y=y)
         return X_t
 
+    def _compute_estimator_features(self, X, y=None):
+        """Computes the estimator features like compute_estimator_features, caching the features computed for the most
+        recent pd.DataFrame input. This way predicting, predicting probabilities and scoring on the same data only applies
+        the components once. The cache is cleared when the pipeline is fit.
+
+        The cached features are shared between the pipeline's own prediction methods and must not be modified or
+        returned to callers.
+        """
+        key = self._estimator_features_key(X, y)
+        if key is not None and self._estimator_features_cache is not None:
+            cached_key, cached_X_t = self._estimator_features_cache
+            if cached_key[0] == key[0] and np.array_equal(cached_key[1], key[1]):
+                return cached_X_t
+        X_t = self.compute_estimator_features(X, y=y)
+        if key is not None:
+            # Pipelines with only an estimator pass X through unchanged, so copy it rather than caching the caller's data
+            self._estimator_features_cache = (key, X_t.copy() if X_t is X else X_t)
+        return X_t
+
+    @staticmethod
+    def _estimator_features_key(X, y):
+        """Computes the key the estimator features for X are cached under. The key includes a hash of every row of X,
+        so data which is modified in place is not mistaken for the cached data.
+
+        Returns:
+            tuple or None: The key, or None if the features for X can't be cached.
+        """
+        if y is not None or not isinstance(X, pd.DataFrame):
+            return None
+        try:
+            row_hashes = pd.util.hash_pandas_object(X, index=True).values
+        except TypeError:
+            return None
+        return (tuple(X.columns), tuple(X.dtypes), X.shape), row_hashes
+
     def _compute_features_during_fit(self, X, y):
+        self._estimator_features_cache = None
         self.input_target_name = y.name
         X_t = self._component_graph.fit_features(X, y)
         self.input_feature_names = self._component_graph.input_feature_names
         return X_t
 
     def _fit(self, X, y):
+        self._estimator_features_cache = None
         self.input_target_name = y.name
         self._component_graph.fit(X, y)
         self.input_feature_names = self._component_graph.input_feature_names
@@ -218,18 +257,23 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
         Returns:
             pd.Series: Predicted values.
         """
-        X = _convert_to_woodwork_structure(X)
-        predictions = self._component_graph.predict(X)
+        if self.estimator is None:
+            predictions = self._component_graph.predict(X)
+        else:
+            X_t = self._compute_estimator_features(X, y=None)
+            predictions = self.estimator.predict(X_t)
         return predictions.rename(self.input_target_name)
 
     @abstractmethod
-    def score(self, X, y, objectives):
+    def score(self, X, y, objectives, n_jobs=None):
         """Evaluate model performance on current and additional objectives
 
         Arguments:
             X (ww.DataTable, pd.DataFrame or np.ndarray): Data of shape [n_samples, n_features]
             y (pd.Series, ww.DataColumn, or np.ndarray): True labels of length [n_samples]
             objectives (list): Non-empty list of objectives to score on
+            n_jobs (int or None): Number of threads used to score the objectives in parallel once the predictions are computed.
+                None and 1 are equivalent. If set to -1, all CPUs are used. Defaults to None.
 
         Returns:
             dict: Ordered dictionary of objective scores
@@ -239,7 +283,17 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
     def _score(X, y, predictions, objective):
         return objective.score(y, predictions, X)
 
-    def _score_all_objectives(self, X, y, y_pred, y_pred_proba, objectives):
+    def _score_objective(self, X, y, y_pred, y_pred_proba, objective):
+        """Scores a single objective, returning a tuple of the score and None, or None and the (exception, traceback) raised."""
+        try:
+            if not objective.is_defined_for_problem_type(self.problem_type):
+                raise ValueError(f'Invalid objective {objective.name} specified for problem type {self.problem_type}')
+            return self._score(X, y, y_pred_proba if objective.score_needs_proba else y_pred, objective), None
+        except Exception as e:
+            tb = traceback.format_tb(sys.exc_info()[2])
+            return None, (e, tb)
+
+    def _score_all_objectives(self, X, y, y_pred, y_pred_proba, objectives, n_jobs=None):
         """Given data, model predictions or predicted probabilities computed on the data, and an objective, evaluate and return the objective score.
 
         Will raise a PipelineScoreError if any objectives fail.
@@ -250,18 +304,21 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
             y_pred_proba (pd.Dataframe, pd.Series, None): The predicted probabilities for classification problems.
                 Will be a DataFrame for multiclass problems and Series otherwise. Will be None for regression problems.
             objectives (list): List of objectives to score.
+            n_jobs (int or None): Number of threads used to score the objectives in parallel. None and 1 are equivalent,
+                scoring the objectives sequentially. Defaults to None.
         """
+        if n_jobs in (None, 1):
+            results = [self._score_objective(X, y, y_pred, y_pred_proba, objective) for objective in objectives]
+        else:
+            results = Parallel(n_jobs=n_jobs, backend='threading')(delayed(self._score_objective)(X, y, y_pred, y_pred_proba, objective)
+                                                                   for objective in objectives)
         scored_successfully = OrderedDict()
         exceptions = OrderedDict()
-        for objective in objectives:
-            try:
-                if not objective.is_defined_for_problem_type(self.problem_type):
-                    raise ValueError(f'Invalid objective {objective.name} specified for problem type {self.problem_type}')
-                score = self._score(X, y, y_pred_proba if objective.score_needs_proba else y_pred, objective)
+        for objective, (score, exception) in zip(objectives, results):
+            if exception is None:
                 scored_successfully.update({objective.name: score})
-            except Exception as e:
-                tb = traceback.format_tb(sys.exc_info()[2])
-                exceptions[objective.name] = (e, tb)
+            else:
+                exceptions[objective.name] = exception
         if exceptions:
             # If any objective failed, throw an PipelineScoreError
             raise PipelineScoreError(exceptions, scored_successfully)
@@ -335,9 +392,12 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
             pd.DataFrame including feature names and their corresponding importance
         """
         feature_names = self.input_feature_names[self._estimator_name]
-        importance = list(zip(feature_names, self.estimator.feature_importance))  # note: this only works for binary
-        importance.sort(key=lambda x: -abs(x[1]))
-        df = pd.DataFrame(importance, columns=["feature", "importance"])
+        importance = np.asarray(self.estimator.feature_importance)  # note: this only works for binary
+        n_features = min(len(feature_names), len(importance))
+        feature_names = np.asarray(feature_names, dtype=object)[:n_features]
+        importance = importance[:n_features]
+        order = np.argsort(-np.abs(importance), kind='stable')
+        df = pd.DataFrame({"feature": feature_names[order].tolist(), "importance": importance[order]})
         return df
 
     def graph(self, filepath=None):
@@ -493,6 +553,11 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
         parameters_repr = ' '.join([f"'{component}':{{{repr_component(parameters)}}}," for component, parameters in self.parameters.items()])
         return f'{(type(self).__name__)}(parameters={{{parameters_repr}}})'
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_estimator_features_cache'] = None
+        return state
+
     def __iter__(self):
         return self
 
@@ -15,6 +15,8 @@ class PipelineBaseMeta(BaseMeta):
         """`check_for_fit` wraps a method that validates if `self._is_fitted` is `True`.
             It raises an exception if `False` and calls and returns the wrapped method if `True`.
         """
+        takes_objective = len(inspect.getfullargspec(method).args) == 4
+
         @wraps(method)
         def _check_for_fit(self, X=None, y=None, objective=None):
             klass = type(self).__name__
@@ -25,7 +27,7 @@ class PipelineBaseMeta(BaseMeta):
             elif y is None:
                 return method(self, X)
             # For time series classification pipelines, predict will take X, y, objective
-            elif len(inspect.getfullargspec(method).args) == 4:
+            elif takes_objective:
                 return method(self, X, y, objective)
             # For other pipelines, predict will take X, y or X, objective
             else:
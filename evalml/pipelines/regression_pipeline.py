@@ -31,17 +31,19 @@ class RegressionPipeline(PipelineBase):
         self._fit(X, y)
         return self
 
-    def score(self, X, y, objectives):
+    def score(self, X, y, objectives, n_jobs=None):
         """Evaluate model performance on current and additional objectives
 
         Arguments:
             X (ww.DataTable, pd.DataFrame, or np.ndarray): Data of shape [n_samples, n_features]
             y (ww.DataColumn, pd.Series, or np.ndarray): True values of length [n_samples]
             objectives (list): Non-empty list of objectives to score on
+            n_jobs (int or None): Number of threads used to score the objectives in parallel once the predictions are computed.
+                None and 1 are equivalent. If set to -1, all CPUs are used. Defaults to None.
 
         Returns:
             dict: Ordered dictionary of objective scores
         """
         objectives = [get_objective(o, return_instance=True) for o in objectives]
         y_predicted = self.predict(X)
-        return self._score_all_objectives(X, y, y_predicted, y_pred_proba=None, objectives=objectives)
+        return self._score_all_objectives(X, y, y_predicted, y_pred_proba=None, objectives=objectives, n_jobs=n_jobs)
@@ -1,6 +1,9 @@
 import pandas as pd
 
 from evalml.objectives import get_objective
+from evalml.objectives.binary_classification_objective import (
+    _threshold_probabilities
+)
 from evalml.pipelines.classification_pipeline import ClassificationPipeline
 from evalml.problem_types import ProblemTypes
 from evalml.utils.gen_utils import (
@@ -147,13 +150,15 @@ class TimeSeriesClassificationPipeline(ClassificationPipeline):
             y_predicted = self._predict(X, y, pad=True)
         return y_predicted, y_predicted_proba
 
-    def score(self, X, y, objectives):
+    def score(self, X, y, objectives, n_jobs=None):
         """Evaluate model performance on current and additional objectives.
 
         Arguments:
             X (ww.DataTable, pd.DataFrame or np.ndarray): Data of shape [n_samples, n_features]
             y (pd.Series, ww.DataColumn): True labels of length [n_samples]
             objectives (list): Non-empty list of objectives to score on
+            n_jobs (int or None): Number of threads used to score the objectives in parallel once the predictions are computed.
+                None and 1 are equivalent. If set to -1, all CPUs are used. Defaults to None.
 
         Returns:
             dict: Ordered dictionary of objective scores
@@ -169,7 +174,8 @@ class TimeSeriesClassificationPipeline(ClassificationPipeline):
         y_shifted, y_pred, y_pred_proba = drop_rows_with_nans(y_shifted, y_pred, y_pred_proba)
         return self._score_all_objectives(X, y_shifted, y_pred,
                                           y_pred_proba=y_pred_proba,
-                                          objectives=objectives)
+                                          objectives=objectives,
+                                          n_jobs=n_jobs)
 
 
 class TimeSeriesBinaryClassificationPipeline(TimeSeriesClassificationPipeline):
@@ -199,7 +205,7 @@ class TimeSeriesBinaryClassificationPipeline(TimeSeriesClassificationPipeline):
             proba = self._estimator_predict_proba(features_no_nan, y_no_nan)
             proba = proba.iloc[:, 1]
             if objective is None:
-                predictions = proba > self.threshold
+                predictions = _threshold_probabilities(proba, self.threshold)
             else:
                 predictions = objective.decision_function(proba, threshold=self.threshold, X=features_no_nan)
         if pad:
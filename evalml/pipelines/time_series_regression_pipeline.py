@@ -87,13 +87,15 @@ class TimeSeriesRegressionPipeline(RegressionPipeline):
         predictions = predictions.rename(self.input_target_name)
         return pad_with_nans(predictions, max(0, features.shape[0] - predictions.shape[0]))
 
-    def score(self, X, y, objectives):
+    def score(self, X, y, objectives, n_jobs=None):
         """Evaluate model performance on current and additional objectives.
 
         Arguments:
             X (ww.DataTable, pd.DataFrame or np.ndarray): Data of shape [n_samples, n_features]
             y (pd.Series, ww.DataColumn): True labels of length [n_samples]
             objectives (list): Non-empty list of objectives to score on
+            n_jobs (int or None): Number of threads used to score the objectives in parallel once the predictions are computed.
+                None and 1 are equivalent. If set to -1, all CPUs are used. Defaults to None.
 
         Returns:
             dict: Ordered dictionary of objective scores
@@ -113,4 +115,5 @@ class TimeSeriesRegressionPipeline(RegressionPipeline):
         return self._score_all_objectives(X, y_shifted,
                                           y_predicted,
                                           y_pred_proba=None,
-                                          objectives=objectives)
+                                          objectives=objectives,
+                                          n_jobs=n_jobs)
@@ -1,3 +1,6 @@
+from unittest.mock import patch
+
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -57,3 +60,37 @@ def test_feature_selector_missing_component_obj():
         mock_feature_selector.transform(pd.DataFrame())
     with pytest.raises(RuntimeError, match="Transformer requires a fit_transform method or a component_obj that implements fit_transform"):
         mock_feature_selector.fit_transform(pd.DataFrame())
+
+
+@pytest.mark.parametrize("data_type", ['pd', 'np'])
+@pytest.mark.parametrize("use_fit_transform", [True, False])
+def test_feature_selectors_compute_selected_features_once(use_fit_transform, data_type, X_y_binary, X_y_regression):
+    rf_classifier, rf_regressor = make_rf_feature_selectors()
+    for selector, (X, y) in [(rf_classifier, X_y_binary), (rf_regressor, X_y_regression)]:
+        X = pd.DataFrame(X, columns=[f"col_{i}" for i in range(X.shape[1])], index=np.arange(X.shape[0]) + 10)
+        if data_type == 'np':
+            X = X.values
+        if use_fit_transform:
+            X_t = selector.fit_transform(X, y)
+        else:
+            X_t = selector.fit(X, y).transform(X)
+        expected_mask = selector._component_obj.get_support()
+        expected_X_t = selector._component_obj.transform(X)
+
+        with patch.object(selector._component_obj, 'get_support') as mock_get_support:
+            X_t_again = selector.transform(X)
+            selected_names = selector.get_names()
+        mock_get_support.assert_not_called()
+
+        np.testing.assert_array_equal(X_t.values, expected_X_t)
+        pd.testing.assert_frame_equal(X_t, X_t_again)
+        if data_type == 'pd':
+            assert selected_names == list(X.columns[expected_mask])
+            assert list(X_t.columns) == selected_names
+            pd.testing.assert_index_equal(X_t.index, X.index)
+        else:
+            assert selected_names == list(np.arange(X.shape[1])[expected_mask])
+            assert list(X_t.columns) == list(range(expected_mask.sum()))
+
+        with pytest.raises(ValueError, match="different shape than during fitting"):
+            selector.transform(X[:, :-1] if data_type == 'np' else X.iloc[:, :-1])
@@ -1,9 +1,13 @@
+from unittest.mock import patch
+
 import numpy as np
 import pandas as pd
 import pytest
+import woodwork as ww
 from pandas.testing import assert_frame_equal
 
 from evalml.pipelines.components import LinearDiscriminantAnalysis
+from evalml.utils.gen_utils import _convert_to_woodwork_structure
 
 
 def test_lda_invalid_init():
@@ -82,6 +86,56 @@ def test_lda_invalid():
         lda.transform(X)
 
 
+@pytest.mark.parametrize('data_type', ['pd', 'np'])
+@patch('evalml.pipelines.components.transformers.dimensionality_reduction.lda._convert_to_woodwork_structure', wraps=_convert_to_woodwork_structure)
+def test_lda_numeric_input_skips_woodwork_conversion(mock_convert, data_type):
+    X = pd.DataFrame([[3, 0, 1, 6.5],
+                      [1, 2, 1, 6.5],
+                      [10, 2, 1, 6.5],
+                      [10, 2, 2, 5.5],
+                      [6, 2, 2, 5.5]], index=[5, 4, 3, 2, 1])
+    if data_type == 'np':
+        X = X.values
+    y = np.array([2, 2, 0, 1, 0])
+    lda = LinearDiscriminantAnalysis()
+    lda.fit(X, y)
+    X_t = lda.transform(X)
+    assert mock_convert.call_count == 1
+    assert mock_convert.call_args[0][0] is y
+
+    expected_X_t = LinearDiscriminantAnalysis().fit(ww.DataTable(X), y).transform(ww.DataTable(X))
+    assert_frame_equal(X_t, expected_X_t)
+    assert list(X_t.columns) == ["component_0", "component_1"]
+
+
+@pytest.mark.parametrize('data_type', ['pd', 'np'])
+def test_lda_transform_after_fit_skips_missing_value_scan(data_type):
+    X = pd.DataFrame([[3, 0, 1, 6.5],
+                      [1, 2, 1, 6.5],
+                      [10, 2, 1, 6.5],
+                      [10, 2, 2, 5.5],
+                      [6, 2, 2, 5.5]])
+    y = [2, 2, 0, 1, 0]
+    X_nan = X.copy()
+    X_nan.iloc[0, 0] = np.nan
+    if data_type == 'np':
+        X, X_nan = X.values, X_nan.values
+    lda = LinearDiscriminantAnalysis()
+    with pytest.raises(ValueError, match="must be all numeric"):
+        lda.fit(X_nan, y)
+    lda.fit(X, y)
+    assert lda._n_features_in == 4
+    if data_type == 'pd':
+        with patch.object(pd.DataFrame, 'isnull') as mock_isnull:
+            lda.transform(X)
+        mock_isnull.assert_not_called()
+    # sklearn still rejects the missing values
+    with pytest.raises(ValueError, match="NaN"):
+        lda.transform(X_nan)
+    with pytest.raises(ValueError, match="must be all numeric"):
+        lda.transform(X_nan[:, :3] if data_type == 'np' else X_nan.iloc[:, :3])
+
+
 def test_n_components():
     X = pd.DataFrame([[3, 0, 1, 6, 5, 10],
                       [1, 3, 1, 3, 11, 4],
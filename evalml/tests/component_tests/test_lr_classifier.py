@@ -0,0 +1,66 @@
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LogisticRegression as SKLogisticRegression
+from threadpoolctl import threadpool_limits
+
+from evalml.model_family import ModelFamily
+from evalml.pipelines.components.estimators.classifiers import (
+    LogisticRegressionClassifier
+)
+from evalml.problem_types import ProblemTypes
+
+
+def test_model_family():
+    assert LogisticRegressionClassifier.model_family == ModelFamily.LINEAR_MODEL
+
+
+def test_problem_types():
+    assert set(LogisticRegressionClassifier.supported_problem_types) == {ProblemTypes.BINARY, ProblemTypes.MULTICLASS,
+                                                                         ProblemTypes.TIME_SERIES_BINARY,
+                                                                         ProblemTypes.TIME_SERIES_MULTICLASS}
+
+
+@pytest.mark.parametrize("data_type", ["binary", "multi"])
+def test_fit_predict(data_type, X_y_binary, X_y_multi):
+    X, y = X_y_binary if data_type == "binary" else X_y_multi
+
+    sk_clf = SKLogisticRegression(n_jobs=-1, random_state=0)
+    sk_clf.fit(X, y)
+    y_pred_sk = sk_clf.predict(X)
+    y_pred_proba_sk = sk_clf.predict_proba(X)
+
+    clf = LogisticRegressionClassifier()
+    fitted = clf.fit(pd.DataFrame(X), y)
+    assert isinstance(fitted, LogisticRegressionClassifier)
+
+    y_pred = clf.predict(X)
+    y_pred_proba = clf.predict_proba(X)
+
+    np.testing.assert_almost_equal(y_pred, y_pred_sk, decimal=5)
+    np.testing.assert_almost_equal(y_pred_proba, y_pred_proba_sk, decimal=5)
+
+
+@pytest.mark.parametrize("solver,dtype", [("lbfgs", np.float64), ("liblinear", np.float64), ("saga", np.float32)])
+def test_solver_input_dtype(solver, dtype, X_y_binary):
+    X, y = X_y_binary
+    clf = LogisticRegressionClassifier(solver=solver)
+    X_t = clf._component_obj._to_array(pd.DataFrame(X))
+    assert X_t.dtype == dtype
+    assert X_t.flags['C_CONTIGUOUS']
+    clf.fit(X, y)
+    assert len(clf.predict(X)) == len(y)
+    assert clf.predict_proba(X).shape == (len(y), 2)
+
+
+@pytest.mark.parametrize("n_jobs,expected_limit", [(-1, None), (None, None), (1, 1), (2, 2)])
+def test_fit_limits_blas_threads(n_jobs, expected_limit, X_y_binary):
+    X, y = X_y_binary
+    clf = LogisticRegressionClassifier(n_jobs=n_jobs)
+    with patch('evalml.pipelines.components.estimators.classifiers.logistic_regression.threadpool_limits',
+               wraps=threadpool_limits) as mock_limits:
+        clf.fit(X, y)
+    mock_limits.assert_called_once_with(limits=expected_limit, user_api='blas')
+    assert len(clf.predict(X)) == len(y)
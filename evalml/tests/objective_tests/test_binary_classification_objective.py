@@ -47,3 +47,11 @@ def test_decision_function_neg():
     obj = F1()
     pd.testing.assert_series_equal(obj.decision_function(ypred_proba), y_true)
     pd.testing.assert_series_equal(obj.decision_function(pd.Series(ypred_proba, dtype=float)), y_true)
+
+
+def test_decision_function_keeps_index_and_name():
+    ypred_proba = pd.Series(np.arange(6) / 5.0, index=[10, 11, 12, 13, 14, 15], name='probabilities')
+    obj = F1()
+    pd.testing.assert_series_equal(obj.decision_function(ypred_proba, threshold=0.5), ypred_proba > 0.5)
+    pd.testing.assert_series_equal(obj.decision_function(pd.Series([0.2, np.nan, 0.8]), threshold=0.5),
+                                   pd.Series([False, False, True]))
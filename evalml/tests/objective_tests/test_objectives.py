@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -17,6 +19,7 @@ from evalml.objectives import (
 from evalml.objectives.objective_base import ObjectiveBase
 from evalml.objectives.utils import _all_objectives_dict
 from evalml.problem_types import ProblemTypes
+from evalml.utils.gen_utils import _get_subclasses
 
 
 def test_create_custom_objective():
@@ -45,6 +48,19 @@ def test_get_objective_works_for_names_of_defined_objectives(obj):
     assert isinstance(get_objective(obj(*args)), obj)
 
 
+@patch('evalml.objectives.utils._get_subclasses', wraps=_get_subclasses)
+def test_get_objective_searches_subclasses_once(mock_get_subclasses):
+    expected_objectives = _all_objectives_dict()
+    _all_objectives_dict.cache_clear()
+    try:
+        for name in ['f1', 'AUC', 'log loss binary', 'R2']:
+            assert get_objective(name) == expected_objectives[name.lower()]
+        assert get_all_objective_names() == list(expected_objectives.keys())
+        assert mock_get_subclasses.call_count == 1
+    finally:
+        _all_objectives_dict.cache_clear()
+
+
 def test_get_objective_does_raises_error_for_incorrect_name_or_random_class():
 
     class InvalidObjective:
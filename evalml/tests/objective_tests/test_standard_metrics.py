@@ -3,9 +3,11 @@ from itertools import product
 import numpy as np
 import pandas as pd
 import pytest
+from sklearn import metrics as sk_metrics
 from sklearn.metrics import matthews_corrcoef as sk_matthews_corrcoef
 
 from evalml.objectives import (
+    AUC,
     F1,
     MAPE,
     MSE,
@@ -32,7 +34,8 @@ from evalml.objectives import (
     RecallMicro,
     RecallWeighted,
     RootMeanSquaredError,
-    RootMeanSquaredLogError
+    RootMeanSquaredLogError,
+    _fast_metrics
 )
 from evalml.objectives.utils import (
     _all_objectives_dict,
@@ -438,6 +441,87 @@ def test_mcc_catches_warnings():
         assert len(record) == 0
 
 
+@pytest.mark.parametrize("use_numba", [True, False])
+@pytest.mark.parametrize("objective_class,sk_metric", [(F1, sk_metrics.f1_score),
+                                                       (Precision, sk_metrics.precision_score),
+                                                       (Recall, sk_metrics.recall_score),
+                                                       (MCCBinary, sk_matthews_corrcoef)])
+def test_binary_confusion_matrix_metrics_match_sklearn(objective_class, sk_metric, use_numba, monkeypatch):
+    if not use_numba:
+        monkeypatch.setattr(_fast_metrics, "_confusion_matrix", None)
+    sk_kwargs = {} if sk_metric is sk_matthews_corrcoef else {"zero_division": 0.0}
+    rs = np.random.RandomState(0)
+    y_true = rs.randint(0, 2, 100)
+    y_pred = rs.randint(0, 2, 100)
+    obj = objective_class()
+    assert obj.score(y_true, y_pred) == pytest.approx(sk_metric(y_true, y_pred, **sk_kwargs), EPS)
+    assert obj.score(pd.Series(y_true), pd.Series(y_pred.astype(bool))) == pytest.approx(sk_metric(y_true, y_pred, **sk_kwargs), EPS)
+    assert obj.score(np.zeros(10), np.zeros(10)) == pytest.approx(0.0, EPS)
+
+
+@pytest.mark.parametrize("objective_class", [F1, Precision, Recall, MCCBinary])
+def test_binary_confusion_matrix_metrics_inconsistent_lengths(objective_class):
+    with pytest.raises(ValueError, match="inconsistent numbers of samples"):
+        objective_class().objective_function(np.array([0, 1, 1, 1, 1, 1]), np.array([1, 1]))
+
+
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_binary_confusion_matrix(use_numba, monkeypatch):
+    if not use_numba:
+        monkeypatch.setattr(_fast_metrics, "_confusion_matrix", None)
+    np.testing.assert_array_equal(_fast_metrics.binary_confusion_matrix([0, 1, 1, 1], [0, 1, 0, 1]), [[1, 0], [1, 2]])
+    np.testing.assert_array_equal(_fast_metrics.binary_confusion_matrix(pd.Series([True, False]), pd.Series([1.0, 1.0])), [[0, 1], [0, 1]])
+    assert _fast_metrics.binary_confusion_matrix([1, 2], [1, 2]) is None
+    assert _fast_metrics.binary_confusion_matrix(["a", "b"], [0, 1]) is None
+    assert _fast_metrics.binary_confusion_matrix([0, 1], [0.5, 1]) is None
+    assert _fast_metrics.binary_confusion_matrix(np.zeros(3), np.zeros(3)).dtype.kind == 'i'
+    assert _fast_metrics.binary_confusion_matrix([0, 1, 1, 1, 1, 1], [1, 1]) is None
+    assert _fast_metrics.binary_confusion_matrix([0, 1], [1]) is None
+    assert _fast_metrics.binary_confusion_matrix([[0, 1]], [[0, 1]]) is None
+
+
+@pytest.mark.parametrize("use_numba", [True, False])
+@pytest.mark.parametrize("objective_class,sk_metric,kernel_name", [(AUC, sk_metrics.roc_auc_score, "_auc"),
+                                                                   (LogLossBinary, sk_metrics.log_loss, "_log_loss")])
+def test_binary_probability_metrics_match_sklearn(objective_class, sk_metric, kernel_name, use_numba, monkeypatch):
+    if not use_numba:
+        monkeypatch.setattr(_fast_metrics, kernel_name, None)
+    rs = np.random.RandomState(0)
+    y_true = rs.randint(0, 2, 100)
+    y_proba = rs.rand(100)
+    obj = objective_class()
+    assert obj.score(y_true, y_proba) == pytest.approx(sk_metric(y_true, y_proba), EPS)
+    assert obj.score(pd.Series(y_true.astype(bool)), pd.Series(y_proba)) == pytest.approx(sk_metric(y_true, y_proba), EPS)
+
+    # tied scores, and probabilities of exactly 0 and 1 which log loss clips
+    y_proba_tied = np.round(y_proba, 1)
+    assert obj.score(y_true, y_proba_tied) == pytest.approx(sk_metric(y_true, y_proba_tied), EPS)
+
+    with pytest.raises(ValueError):
+        obj.score(np.ones(10), np.linspace(0, 1, 10))
+
+
+@pytest.mark.parametrize("y_true,y_proba", [([0, 1, 0, 1], [1.0, 0.9, 0.2, 0.7]),
+                                            ([0, 1, 0, 1, 1, 0], [0.0, 1.0, 1.0, 0.0, 0.5, 1 - 1e-16])])
+def test_log_loss_binary_clipped_probabilities_match_sklearn(y_true, y_proba):
+    assert LogLossBinary().score(np.array(y_true), np.array(y_proba)) == pytest.approx(sk_metrics.log_loss(y_true, y_proba), abs=1e-12)
+
+
+def test_binary_auc_and_log_loss():
+    if _fast_metrics.numba is None:
+        assert _fast_metrics.binary_auc([0, 1, 1], [0.1, 0.9, 0.4]) is None
+        assert _fast_metrics.binary_log_loss([0, 1, 1], [0.1, 0.9, 0.4]) is None
+        return
+    assert _fast_metrics.binary_auc([0, 1, 1, 0], [0.1, 0.9, 0.4, 0.4]) == pytest.approx(0.875)
+    assert _fast_metrics.binary_log_loss([0, 1], [0.0, 1.0]) == pytest.approx(-np.log(1 - 1e-15))
+    np.testing.assert_allclose(_fast_metrics._log_loss(np.array([0.25, 0.25, 1.0]), np.array([1, 0, 0], dtype=np.int8), 1e-15),
+                               [-np.log(0.25), -np.log(0.75), -np.log(1 - (1 - 1e-15))])
+    assert _fast_metrics.binary_auc([1, 2], [0.1, 0.9]) is None
+    assert _fast_metrics.binary_auc([1, 1], [0.1, 0.9]) is None
+    assert _fast_metrics.binary_log_loss([0, 1], [[0.9, 0.1], [0.2, 0.8]]) is None
+    assert _fast_metrics.binary_log_loss([0, 1], ["a", "b"]) is None
+
+
 def test_mape_time_series_model():
     obj = MAPE()
 
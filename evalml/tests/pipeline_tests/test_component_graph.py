@@ -420,6 +420,21 @@ def test_predict(mock_predict, mock_fit, example_graph, X_y_binary):
     assert mock_fit.call_count == 3  # Only called during fit, not predict
 
 
+def test_compute_plan_reused(example_graph, X_y_binary):
+    X, y = X_y_binary
+    component_graph = ComponentGraph(example_graph).instantiate({})
+    component_graph.fit(X, y)
+    expected_predictions = component_graph.predict(X)
+
+    with patch.object(component_graph, 'get_parents', wraps=component_graph.get_parents) as mock_get_parents:
+        with patch.object(component_graph, 'get_component', wraps=component_graph.get_component) as mock_get_component:
+            predictions = component_graph.predict(X)
+    assert mock_get_parents.call_count == 0
+    assert mock_get_component.call_count == 0
+    pd.testing.assert_series_equal(predictions, expected_predictions)
+    assert list(component_graph._compute_plans.keys()) == [tuple(component_graph.compute_order)]
+
+
 @patch('evalml.pipelines.components.Estimator.fit')
 @patch('evalml.pipelines.components.Estimator.predict')
 def test_predict_repeat_estimator(mock_predict, mock_fit, X_y_binary):
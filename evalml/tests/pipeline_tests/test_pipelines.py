@@ -1,5 +1,5 @@
 import os
-from unittest.mock import patch
+from unittest.mock import PropertyMock, patch
 
 import cloudpickle
 import numpy as np
@@ -16,9 +16,10 @@ from evalml.exceptions import (
     PipelineScoreError
 )
 from evalml.model_family import ModelFamily
-from evalml.objectives import FraudCost, Precision
+from evalml.objectives import AUC, F1, FraudCost, Precision
 from evalml.pipelines import (
     BinaryClassificationPipeline,
+    ComponentGraph,
     MulticlassClassificationPipeline,
     PipelineBase,
     RegressionPipeline
@@ -908,11 +909,13 @@ def test_score_multiclass_single(mock_predict, mock_fit, mock_encode, X_y_binary
 
 @patch('evalml.pipelines.MulticlassClassificationPipeline._encode_targets')
 @patch('evalml.pipelines.MulticlassClassificationPipeline.fit')
-@patch('evalml.pipelines.ComponentGraph.predict')
-def test_score_nonlinear_multiclass(mock_encode, mock_fit, mock_predict, nonlinear_multiclass_pipeline_class, X_y_multi):
+@patch('evalml.pipelines.ComponentGraph.compute_final_component_features')
+@patch('evalml.pipelines.components.Estimator.predict')
+def test_score_nonlinear_multiclass(mock_predict, mock_compute_features, mock_fit, mock_encode, nonlinear_multiclass_pipeline_class, X_y_multi):
     X, y = X_y_multi
     mock_predict.return_value = y
     mock_encode.return_value = y
+    mock_compute_features.return_value = X
     clf = nonlinear_multiclass_pipeline_class({})
     clf.fit(X, y)
     objective_names = ['f1 micro', 'precision micro']
@@ -1012,12 +1015,14 @@ def test_score_binary_objective_error(mock_predict, mock_fit, mock_objective_sco
 @patch('evalml.pipelines.BinaryClassificationPipeline._encode_targets')
 @patch('evalml.objectives.F1.score')
 @patch('evalml.pipelines.BinaryClassificationPipeline.fit')
-@patch('evalml.pipelines.ComponentGraph.predict')
-def test_score_nonlinear_binary_objective_error(mock_predict, mock_fit, mock_objective_score, mock_encode, nonlinear_binary_pipeline_class, X_y_binary):
+@patch('evalml.pipelines.ComponentGraph.compute_final_component_features')
+@patch('evalml.pipelines.components.Estimator.predict')
+def test_score_nonlinear_binary_objective_error(mock_predict, mock_compute_features, mock_fit, mock_objective_score, mock_encode, nonlinear_binary_pipeline_class, X_y_binary):
     mock_objective_score.side_effect = Exception('finna kabooom 💣')
     X, y = X_y_binary
     mock_predict.return_value = y
     mock_encode.return_value = y
+    mock_compute_features.return_value = X
     clf = nonlinear_binary_pipeline_class({})
     clf.fit(X, y)
     objective_names = ['f1', 'precision']
@@ -1054,6 +1059,27 @@ def test_score_multiclass_objective_error(mock_predict, mock_fit, mock_objective
         assert "F1 Micro" in e.exceptions
 
 
+def test_score_objectives_in_parallel(X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    pipeline = logistic_regression_binary_pipeline_class(parameters={"Logistic Regression Classifier": {"n_jobs": 1}})
+    pipeline.fit(X, y)
+    objective_names = ['f1', 'precision', 'recall', 'auc', 'log loss binary', 'mcc binary']
+    with patch('evalml.pipelines.pipeline_base.Parallel') as mock_parallel:
+        expected_scores = pipeline.score(X, y, objective_names)
+        assert pipeline.score(X, y, objective_names, n_jobs=1) == expected_scores
+    mock_parallel.assert_not_called()
+    scores = pipeline.score(X, y, objective_names, n_jobs=2)
+    assert list(scores.keys()) == list(expected_scores.keys()) == ['F1', 'Precision', 'Recall', 'AUC', 'Log Loss Binary', 'MCC Binary']
+    assert scores == expected_scores
+
+    with patch('evalml.objectives.F1.score', side_effect=Exception('finna kabooom 💣')):
+        with pytest.raises(PipelineScoreError) as e:
+            pipeline.score(X, y, objective_names, n_jobs=2)
+    assert list(e.value.scored_successfully.keys()) == ['Precision', 'Recall', 'AUC', 'Log Loss Binary', 'MCC Binary']
+    assert list(e.value.exceptions.keys()) == ['F1']
+    assert 'finna kabooom 💣' in e.value.message
+
+
 @patch('evalml.pipelines.components.Imputer.transform')
 @patch('evalml.pipelines.components.OneHotEncoder.transform')
 @patch('evalml.pipelines.components.StandardScaler.transform')
@@ -1339,6 +1365,85 @@ def test_score_auc(X_y_binary, logistic_regression_binary_pipeline_class):
     lr_pipeline.score(X, y, ['auc'])
 
 
+@pytest.mark.parametrize("threshold", [None, 0.6])
+def test_score_computes_estimator_features_once(threshold, X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    lr_pipeline = logistic_regression_binary_pipeline_class(parameters={"Logistic Regression Classifier": {"n_jobs": 1}})
+    lr_pipeline.fit(X, y)
+    lr_pipeline.threshold = threshold
+    with patch.object(ComponentGraph, 'compute_final_component_features',
+                      wraps=lr_pipeline._component_graph.compute_final_component_features) as mock_features:
+        scores = lr_pipeline.score(X, y, ['f1', 'auc'])
+    assert mock_features.call_count == 1
+    expected_scores = {"F1": F1().score(y, lr_pipeline.predict(X)),
+                       "AUC": AUC().score(y, lr_pipeline.predict_proba(X).iloc[:, 1])}
+    assert scores == pytest.approx(expected_scores)
+
+
+def test_compute_estimator_features_cache(X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    lr_pipeline = logistic_regression_binary_pipeline_class(parameters={"Logistic Regression Classifier": {"n_jobs": 1}})
+    lr_pipeline.fit(X, y)
+    with patch.object(ComponentGraph, 'compute_final_component_features',
+                      wraps=lr_pipeline._component_graph.compute_final_component_features) as mock_features:
+        predictions = lr_pipeline.predict(X)
+        proba = lr_pipeline.predict_proba(X)
+        assert mock_features.call_count == 1
+        pd.testing.assert_series_equal(lr_pipeline.predict(X.copy()), predictions)
+        assert mock_features.call_count == 1
+
+        # modifying the data in place invalidates the cache
+        X.iloc[:, 0] = 0
+        assert not lr_pipeline.predict_proba(X).equals(proba)
+        assert mock_features.call_count == 2
+
+        # features are not cached for non-dataframe inputs
+        lr_pipeline.predict(X.values)
+        lr_pipeline.predict(X.values)
+        assert mock_features.call_count == 4
+
+        lr_pipeline.fit(X, y)
+        assert lr_pipeline._estimator_features_cache is None
+
+
+def test_compute_estimator_features_cache_does_not_share_data(X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    X_orig = X.copy()
+
+    class EstimatorOnlyPipeline(BinaryClassificationPipeline):
+        component_graph = ['Logistic Regression Classifier']
+
+    pipeline = EstimatorOnlyPipeline(parameters={"Logistic Regression Classifier": {"n_jobs": 1}})
+    pipeline.fit(X, y)
+    expected_proba = pipeline.predict_proba(X_orig.copy())
+    pipeline.predict(X)
+    X.iloc[:, 0] = 1000
+    pd.testing.assert_frame_equal(pipeline.predict_proba(X_orig.copy()), expected_proba)
+
+    lr_pipeline = logistic_regression_binary_pipeline_class(parameters={"Logistic Regression Classifier": {"n_jobs": 1}})
+    lr_pipeline.fit(X_orig, y)
+    expected_predictions = lr_pipeline.predict(X_orig)
+    X_t = lr_pipeline.compute_estimator_features(X_orig)
+    X_t.iloc[:, 0] = 1000
+    pd.testing.assert_series_equal(lr_pipeline.predict(X_orig), expected_predictions)
+
+
+def test_regression_predict_uses_estimator_features(X_y_regression, linear_regression_pipeline_class):
+    X, y = X_y_regression
+    X = pd.DataFrame(X)
+    pipeline = linear_regression_pipeline_class(parameters={"Linear Regressor": {"n_jobs": 1}})
+    pipeline.fit(X, y)
+    expected_predictions = pipeline._component_graph.predict(X).rename(pipeline.input_target_name)
+    with patch.object(ComponentGraph, 'compute_final_component_features',
+                      wraps=pipeline._component_graph.compute_final_component_features) as mock_features:
+        pd.testing.assert_series_equal(pipeline.predict(X), expected_predictions)
+        pd.testing.assert_series_equal(pipeline.predict(ww.DataTable(X)), expected_predictions)
+        pipeline.score(X, y, ['r2', 'mse'])
+        assert mock_features.call_count == 2
+
+
 def test_pipeline_summary():
     class MockPipelineWithoutEstimator(PipelineBase):
         component_graph = ["Imputer", "One Hot Encoder"]
@@ -1508,6 +1613,18 @@ def test_feature_importance_has_feature_names(X_y_binary, logistic_regression_bi
     assert sorted(clf.feature_importance["feature"]) == sorted(col_names)
 
 
+@patch('evalml.pipelines.components.LogisticRegressionClassifier.feature_importance', new_callable=PropertyMock)
+def test_feature_importance_sorted_by_absolute_value(mock_feature_importance, X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    X = pd.DataFrame(X[:, :5], columns=['a', 'b', 'c', 'd', 'e'])
+    mock_feature_importance.return_value = np.array([0.1, -0.5, 0.3, 0.5, -0.1])
+    clf = logistic_regression_binary_pipeline_class(parameters={"Logistic Regression Classifier": {"n_jobs": 1}})
+    clf.fit(X, y)
+    expected = pd.DataFrame({"feature": ['b', 'd', 'c', 'a', 'e'],
+                             "importance": [-0.5, 0.5, 0.3, 0.1, -0.1]})
+    pd.testing.assert_frame_equal(clf.feature_importance, expected)
+
+
 def test_nonlinear_feature_importance_has_feature_names(X_y_binary, nonlinear_binary_pipeline_class):
     X, y = X_y_binary
     col_names = ["col_{}".format(i) for i in range(len(X[0]))]